@@ -1,8 +1,20 @@
 #!/usr/bin/env python3
 import os
+import hashlib
+import heapq
+import json
+import time
 import requests
+try:
+    import orjson  # Optional: much faster JSON parsing of the multi-MB bootstrap payload
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import re # For cleaning player names
 
 # === CONFIG ===
@@ -10,58 +22,270 @@ TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 CHAT_ID = os.getenv("CHAT_ID")
 # === ACTION REQUIRED: REPLACE 'None' WITH YOUR FPL TEAM ID (e.g., '123456') ===
 FPL_TEAM_ID = '124780'  # <-- REPLACE 'None' with your numerical FPL Team ID (e.g., FPL_TEAM_ID = '123456')
+# The personal sections (team summary, squad analysis) only run when a team ID is set
+HAS_PERSONAL = bool(FPL_TEAM_ID)
 
 FPL_API_URL = "https://fantasy.premierleague.com/api/bootstrap-static/"
 FIXTURES_URL = "https://fantasy.premierleague.com/api/fixtures/"
 POSITION_MAP = {1: "Goalkeepers", 2: "Defenders", 3: "Midfielders", 4: "Forwards"}
+# Fixed (pos_id, pos_name) pairs, iterated by every per-position loop
+POSITIONS = tuple(POSITION_MAP.items())
+DEFAULT_FDR = 3.0  # Neutral difficulty when a team has no upcoming fixtures
+NO_FIXTURE_INFO = (DEFAULT_FDR, "N/A")  # (fdr, fixtures_str) for a player's unknown team
+FDR_CEILING = 5.5  # form_fixture_score = form * (FDR_CEILING - difficulty)
+TELEGRAM_MAX_LENGTH = 4096  # characters per sendMessage
+DIVIDER = "═" * 22  # closes each block of the main digest message
+SECTION_RULE = "—" * 20  # underlines each ranked list in the position summaries
+# (connect, read) timeout in seconds applied to every HTTP call
+REQUEST_TIMEOUT = (3.05, 10)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# On-disk response cache: bootstrap/fixtures change slowly, so reuse recent copies
+# and revalidate stale ones with a conditional GET (ETag -> 304 Not Modified).
+# FPL_CACHE_DIR overrides the location, e.g. to a directory persisted between CI runs.
+CACHE_DIR = os.getenv("FPL_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "fpl_digest")
+BOOTSTRAP_TTL = 300  # seconds
+FIXTURES_TTL = 900  # seconds
+ENTRY_TTL = 3600  # seconds; rank/points only move once per gameweek
+MY_TEAM_TTL = 60  # seconds; picks can change at any time before the deadline
+
+# === HTTP SESSION ===
+# One shared session so FPL and Telegram calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # FPL GETs are idempotent: transient failures are retried with exponential
+    # backoff, and 429s honour Retry-After.
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+# sendMessage is not idempotent: a read timeout or 5xx may follow a delivered message,
+# so only connection failures and explicit 429 rate limits are retried.
+SESSION.mount("https://api.telegram.org/", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=[429],
+        allowed_methods=["POST"],
+    ),
+))
+# Both FPL and Telegram answer in JSON; set the shared headers once, not per request
+SESSION.headers.update({
+    "User-Agent": "fpl-daily-digest (+requests)",
+    "Accept": "application/json",
+})
 
 # === UTILITIES ===
-def clean_and_limit_text(text, limit=4096):
-    """Ensure message length is within Telegram limit."""
-    if len(text) > limit:
-        # Simple truncation, better than crashing
-        print(f"Warning: Message was truncated from {len(text)} to {limit} characters.")
-        return text[:limit]
-    return text
+def _pack(pieces, sep, limit):
+    """Greedily joins pieces with `sep` into as few strings of at most `limit` characters as possible."""
+    chunks, parts, size = [], [], 0
+    for piece in pieces:
+        added = len(piece) + (len(sep) if parts else 0)
+        if parts and size + added > limit:
+            chunks.append(sep.join(parts))
+            parts, size, added = [], 0, len(piece)
+        parts.append(piece)
+        size += added
+    if parts:
+        chunks.append(sep.join(parts))
+    return chunks
+
+def split_message(text, limit=TELEGRAM_MAX_LENGTH):
+    """
+    Splits text into chunks within Telegram's length limit. Breaks fall on blank
+    lines so Markdown pairs such as *bold* are not cut in half; a block too long
+    for one message is split on single line breaks instead.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    pieces = []
+    for block in text.split("\n\n"):
+        if len(block) <= limit:
+            pieces.append(block)
+            continue
+        lines = []
+        for line in block.split("\n"):
+            if len(line) > limit:
+                # A single line longer than the limit is hard-cut as a last resort
+                lines.extend(line[i:i + limit] for i in range(0, len(line), limit))
+            else:
+                lines.append(line)
+        pieces.extend(_pack(lines, "\n", limit))
+
+    # Telegram rejects empty messages, e.g. from runs of leading blank lines
+    return [chunk for chunk in _pack(pieces, "\n\n", limit) if chunk.strip()]
+
+def _to_float(value):
+    """Parses FPL's numeric strings ("4.5"); empty or missing values count as 0.0."""
+    return float(value) if value else 0.0
+
+def _json_loads(raw):
+    """Parses JSON bytes with orjson when available, else the stdlib parser."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(obj):
+    """Serialises to UTF-8 JSON bytes with orjson when available, else the stdlib encoder."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj, ensure_ascii=False).encode()
+
+def _json(response):
+    return _json_loads(response.content)
 
 # === TELEGRAM SEND ===
 def send_telegram_message(text):
-    text = clean_and_limit_text(text)
     if not TELEGRAM_TOKEN or not CHAT_ID:
         print("DEBUG: Telegram token or chat ID missing, skipping send.")
         return
     url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-    payload = {"chat_id": CHAT_ID, "text": text, "parse_mode": "Markdown"}
-    try:
-        response = requests.post(url, data=payload, timeout=10)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"ERROR: Failed to send Telegram message: {e}")
+    # Oversized messages are sent in order as several chunks rather than truncated
+    for chunk in split_message(text):
+        payload = {"chat_id": CHAT_ID, "text": chunk}
+        # An unbalanced '*' makes Telegram reject the message, so send those as plain text
+        if chunk.count("*") % 2 == 0:
+            payload["parse_mode"] = "Markdown"
+        try:
+            # The Bot API accepts JSON bodies, which skips form-urlencoding the text
+            response = SESSION.post(url, data=_json_dumps(payload), headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            print(f"ERROR: Failed to send Telegram message: {e}")
+            continue
+        if response.status_code >= 400:
+            # Telegram explains rejections (e.g. Markdown parse errors) in 'description'
+            try:
+                description = _json(response).get("description", response.reason)
+            except (ValueError, AttributeError):
+                description = response.reason
+            print(f"ERROR: Failed to send Telegram message: {response.status_code} {description}")
 
 # === FPL FETCH (with robustness) ===
-def safe_fetch_json(url):
+def _cache_paths(url):
+    """Returns (body_path, meta_path) for the cached copy of a URL."""
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key)
+    return base + ".json", base + ".meta.json"
+
+def _read_cache(url):
+    """Returns (meta, body_bytes) for a cached URL, or (None, None) if missing/corrupt."""
+    body_path, meta_path = _cache_paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            return meta, f.read()
+    except (OSError, ValueError):
+        return None, None
+
+def _write_cache(url, meta, body=None):
+    """Stores the metadata (and body, when it changed) for a URL. Failures are non-fatal."""
+    body_path, meta_path = _cache_paths(url)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if body is not None:
+            with open(body_path + ".tmp", "wb") as f:
+                f.write(body)
+            os.replace(body_path + ".tmp", body_path)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache for {url}: {e}")
+
+def cached_fetch_json_with_status(url, ttl):
+    """
+    Fetches and parses JSON from `url` through the on-disk cache: a copy younger than
+    `ttl` seconds is served as is, and older copies are revalidated with
+    If-None-Match / If-Modified-Since, so unchanged data costs a 304 only.
+    If the request fails, the last cached copy (however old) is returned instead.
+    Returns (data, is_stale); is_stale is True only for that error fallback, and
+    callers decide whether such a copy is still usable.
+    """
+    meta, body = _read_cache(url)
+    now = time.time()
+    if meta and now - meta.get("fetched_at", 0) < ttl:
+        try:
+            return _json_loads(body), False
+        except ValueError:
+            # An unreadable cached body is ignored and the URL fetched normally
+            print(f"Warning: Discarding unreadable cached copy of {url}.")
+            meta = body = None
+
     try:
-        response = requests.get(url, timeout=10)
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 304 and body is not None:
+            try:
+                data = _json_loads(body)
+            except ValueError:
+                # The validators matched but the stored body is unreadable: fetch it in full
+                print(f"Warning: Discarding unreadable cached copy of {url}.")
+                body = None
+                response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+            else:
+                meta["fetched_at"] = now
+                _write_cache(url, meta)
+                return data, False
+
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        data = _json(response)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"ERROR: Failed to fetch data from {url}: {e}")
-        return None
+        if body is None:
+            return None, False
+        # Stale-if-error: an old copy still produces a digest
+        age_min = int((now - meta.get("fetched_at", now)) // 60)
+        print(f"Warning: Falling back to cached copy of {url} ({age_min} min old).")
+        try:
+            return _json_loads(body), True
+        except ValueError:
+            return None, False
+
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": now,
+    }
+    _write_cache(url, meta, response.content)
+    return data, False
 
 def get_fpl_data():
-    return safe_fetch_json(FPL_API_URL)
+    """Returns (bootstrap, is_stale); see cached_fetch_json_with_status."""
+    return cached_fetch_json_with_status(FPL_API_URL, BOOTSTRAP_TTL)
 
 def get_fixtures():
-    return safe_fetch_json(FIXTURES_URL)
+    """Returns (fixtures, is_stale); see cached_fetch_json_with_status."""
+    return cached_fetch_json_with_status(FIXTURES_URL, FIXTURES_TTL)
+
+def parse_utc_timestamp(value):
+    """Parses an FPL ISO-8601 UTC timestamp such as '2024-08-16T17:30:00Z'."""
+    try:
+        # Python 3.11+ accepts the trailing 'Z' directly, skipping the string copy
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 def get_next_deadline(events):
     for event in events:
         if not event.get("finished", True): 
             try:
-                deadline_str = event.get("deadline_time", "").replace("Z", "+00:00")
+                deadline_str = event.get("deadline_time", "")
                 if not deadline_str:
                     continue
-                deadline = datetime.fromisoformat(deadline_str)
+                deadline = parse_utc_timestamp(deadline_str)
                 return event.get("name", "Unknown GW"), event.get("id"), deadline
             except (ValueError, KeyError) as e:
                 print(f"Warning: Could not parse deadline time for event {event.get('id')}: {e}")
@@ -69,20 +293,23 @@ def get_next_deadline(events):
     return None, None, None
 
 def get_my_team_picks(team_id):
-    """Fetches the current 15 player element IDs in the user's squad."""
+    """
+    Fetches the current 15 player element IDs in the user's squad.
+    Returns (picks, is_stale); is_stale marks picks served from the cached fallback.
+    """
     if not team_id:
-        return None
+        return None, False
     try:
         url = f"https://fantasy.premierleague.com/api/my-team/{team_id}/"
-        data = safe_fetch_json(url)
+        data, is_stale = cached_fetch_json_with_status(url, MY_TEAM_TTL)
         if not data or 'picks' not in data:
-            return None
+            return None, False
         
         # Return a set of element IDs for easy lookup
-        return {pick['element'] for pick in data['picks']}
+        return {pick['element'] for pick in data['picks']}, is_stale
     except Exception as e:
         print(f"ERROR: Failed to fetch user team picks: {e}")
-        return None
+        return None, False
 
 # === DATA PROCESSING ===
 def get_team_data_map(teams):
@@ -103,69 +330,111 @@ def get_team_data_map(teams):
         }
     return team_data
 
-def calculate_fixture_difficulty(fixtures, teams):
-    # Build mapping team_id -> list of upcoming difficulties and return FDR score
-    team_fixtures = {t["id"]: [] for t in teams}
-    for f in fixtures:
-        if not f.get("finished", False):
-            team_fixtures.setdefault(f["team_h"], []).append(f.get("team_h_difficulty", 3))
-            team_fixtures.setdefault(f["team_a"], []).append(f.get("team_a_difficulty", 3))
-    
-    team_fdr = {}
-    for team_id, diffs in team_fixtures.items():
-        upcoming = diffs[:3]
-        avg_diff = round(sum(upcoming) / len(upcoming), 2) if upcoming else 3.0
-        team_fdr[team_id] = avg_diff
-    return team_fdr
-
-def build_fixture_map(fixtures, teams_map_short, current_gw_id):
-    """Returns a map of team_id -> list of next 3 fixture strings (Team Name (Difficulty))"""
+def build_team_fixture_info(fixtures, teams_map_short, current_gw_id):
+    """
+    Returns team_id -> (fdr, fixtures_str) from one pass over each team's next 3
+    unplayed fixtures: fdr is their average difficulty and fixtures_str reads
+    like 'WHU(2), SOU(3), ARS(4)'.
+    """
     team_fixtures = {t_id: [] for t_id in teams_map_short.keys()}
+    difficulty_sums = dict.fromkeys(team_fixtures, 0)
     
     # FIX: Filter for all UNPLAYED fixtures, starting from the current Gameweek onwards.
     # The previous logic incorrectly filtered out the current gameweek's fixtures.
-    relevant_fixtures = sorted([f for f in fixtures if not f.get("finished", False) and f.get("event")], key=lambda x: x["event"])
-
-    for f in relevant_fixtures:
-        # Determine opponent and difficulty for Home team
-        opp_a = teams_map_short.get(f["team_a"], '?')
-        diff_h = f.get("team_h_difficulty", 3)
-        fixture_h_str = f"{opp_a}({diff_h})"
-        
-        # Determine opponent and difficulty for Away team
-        opp_h = teams_map_short.get(f["team_h"], '?')
-        diff_a = f.get("team_a_difficulty", 3)
-        fixture_a_str = f"{opp_h}({diff_a})"
+    relevant_fixtures = sorted([f for f in fixtures if not f.get("finished", False) and f.get("event")], key=itemgetter("event"))
 
-        # Append only if less than 3 fixtures have been added for that team
-        if len(team_fixtures[f["team_h"]]) < 3:
-            team_fixtures[f["team_h"]].append(fixture_h_str)
-        if len(team_fixtures[f["team_a"]]) < 3:
-            team_fixtures[f["team_a"]].append(fixture_a_str)
+    # Fixture slots still open per team; once every team has 3 the scan stops early
+    remaining = dict.fromkeys(team_fixtures, 3)
+    open_slots = 3 * len(remaining)
 
-    # Convert the list of fixture strings into a single, comma-separated string
-    # e.g., 'WHU(2), SOU(3), ARS(4)'
-    return {team_id: ", ".join(fixtures) for team_id, fixtures in team_fixtures.items()}
+    for f in relevant_fixtures:
+        team_h = f["team_h"]
+        team_a = f["team_a"]
+
+        # Strings are only formatted for teams that still need fixtures
+        # Home team: opponent is the away side, with the home difficulty
+        if remaining[team_h]:
+            diff_h = f.get("team_h_difficulty", 3)
+            team_fixtures[team_h].append(f"{teams_map_short.get(team_a, '?')}({diff_h})")
+            difficulty_sums[team_h] += diff_h
+            remaining[team_h] -= 1
+            open_slots -= 1
+
+        # Away team: opponent is the home side, with the away difficulty
+        if remaining[team_a]:
+            diff_a = f.get("team_a_difficulty", 3)
+            team_fixtures[team_a].append(f"{teams_map_short.get(team_h, '?')}({diff_a})")
+            difficulty_sums[team_a] += diff_a
+            remaining[team_a] -= 1
+            open_slots -= 1
+
+        if not open_slots:
+            break
+
+    return {
+        team_id: (
+            round(difficulty_sums[team_id] / len(strs), 2) if strs else DEFAULT_FDR,
+            ", ".join(strs),
+        )
+        for team_id, strs in team_fixtures.items()
+    }
 
 
-def enrich_players(elements, team_fdr, team_fixture_map):
+def enrich_players(elements, team_fixture_info, teams_map_short):
+    # Single pass over all players: derived values are kept in locals and each
+    # field is written once, instead of being read back from the dict.
+    info_get = team_fixture_info.get
+    short_get = teams_map_short.get
     for p in elements:
         cost = p.get("now_cost", 0)
-        p["points_per_cost"] = p.get("total_points", 0) / (cost / 10) if cost else 0
+        total_points = p.get("total_points", 0)
+        points_per_cost = total_points / (cost / 10) if cost else 0
         
-        try:
-            p["form_value"] = float(p.get("form") or 0.0)
-        except Exception:
-            p["form_value"] = 0.0
+        form_value = _to_float(p.get("form"))
+
+        # Ownership arrives as a string ("12.3"); parse it once for filters and display
+        own_pct = _to_float(p.get("selected_by_percent"))
 
         team_id = p.get("team")
-        p["fixture_difficulty"] = team_fdr.get(team_id, 3.0)
-        p["form_fixture_score"] = p["form_value"] * (5.5 - p["fixture_difficulty"])
+        fixture_difficulty, next_fixtures = info_get(team_id, NO_FIXTURE_INFO)
+        form_fixture_score = form_value * (FDR_CEILING - fixture_difficulty)
+
+        p["points_per_cost"] = points_per_cost
+        p["form_value"] = form_value
+        p["own_pct"] = own_pct
+        p["fixture_difficulty"] = fixture_difficulty
+        p["form_fixture_score"] = form_fixture_score
+        # Watchlist ranking: form/fixture weighted double, plus value for money
+        p["watch_score"] = (form_fixture_score * 2) + points_per_cost
         # New: Add the next 3 fixture string
-        p["next_fixtures"] = team_fixture_map.get(team_id, "N/A")
+        p["next_fixtures"] = next_fixtures
+        # Team short name resolved once here so the renderers don't look it up per line
+        p["team_short"] = short_get(team_id, '?')
+        # Has played this season (Total Points > 0); used to pick sell candidates
+        p["active"] = total_points > 0
+        # Guarantee the raw ranking keys exist so sort keys can use itemgetter
+        p.setdefault("total_points", 0)
+        p.setdefault("transfers_in_event", 0)
+        p.setdefault("transfers_out_event", 0)
 
     return elements
 
+def bucket_by_position(elements):
+    """Groups players by element_type in a single pass: pos_id -> list of players."""
+    players_by_pos = {pos_id: [] for pos_id in POSITION_MAP}
+    for p in elements:
+        bucket = players_by_pos.get(p.get("element_type"))
+        if bucket is not None:
+            bucket.append(p)
+    return players_by_pos
+
+def _push_top(heap, k, entry):
+    """Keeps the k largest entries seen so far in `heap` (a min-heap)."""
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
 def get_captaincy_picks(team_data_map, fixtures, current_gw_id):
     """
     Analyzes the next gameweek fixtures based on FPL's team strength metrics
@@ -175,8 +444,11 @@ def get_captaincy_picks(team_data_map, fixtures, current_gw_id):
     # NOTE: Since get_next_deadline returns the ID of the UPCOMING GW, we use that ID.
     next_fixtures = [f for f in fixtures if f.get("event") == current_gw_id] 
 
-    attacking_candidates = []
-    defensive_candidates = []
+    # Bounded min-heaps holding the best 3 of each kind as
+    # (score, -seq, team_id, opponent_id, venue); -seq keeps earlier fixtures on ties.
+    top_attack = []
+    top_defence = []
+    seq = 0
     
     for f in next_fixtures:
         team_h_id = f["team_h"]
@@ -188,255 +460,211 @@ def get_captaincy_picks(team_data_map, fixtures, current_gw_id):
         if not team_h or not team_a:
             continue
 
+        h_attack, h_defence = team_h["attack_strength"], team_h["defence_strength"]
+        a_attack, a_defence = team_a["attack_strength"], team_a["defence_strength"]
+
         # --- Attacking Potential ---
-        # Attacking Score for Team H: H Attack Strength + (6 - A Defence Strength)
-        score_h_att = team_h["attack_strength"] + (6 - team_a["defence_strength"])
-        attacking_candidates.append({
-            "team_id": team_h_id,
-            "opponent_id": team_a_id,
-            "score": score_h_att,
-            "type": "Attacking",
-            "venue": "(H)"
-        })
-        
-        # Attacking Score for Team A: A Attack Strength + (6 - H Defence Strength)
-        score_a_att = team_a["attack_strength"] + (6 - team_h["defence_strength"])
-        attacking_candidates.append({
-            "team_id": team_a_id,
-            "opponent_id": team_h_id,
-            "score": score_a_att,
-            "type": "Attacking",
-            "venue": "(A)"
-        })
+        # Attacking Score: own Attack Strength + (6 - opponent Defence Strength)
+        _push_top(top_attack, 3, (h_attack + (6 - a_defence), -seq, team_h_id, team_a_id, "(H)"))
+        _push_top(top_attack, 3, (a_attack + (6 - h_defence), -seq - 1, team_a_id, team_h_id, "(A)"))
 
         # --- Defensive Potential ---
-        # Defensive Score for Team H: H Defence Strength + (6 - A Attack Strength)
-        score_h_def = team_h["defence_strength"] + (6 - team_a["attack_strength"])
-        defensive_candidates.append({
-            "team_id": team_h_id,
-            "opponent_id": team_a_id,
-            "score": score_h_def,
-            "type": "Defensive",
-            "venue": "(H)"
-        })
-
-        # Defensive Score for Team A: A Defence Strength + (6 - H Attack Strength)
-        score_a_def = team_a["defence_strength"] + (6 - team_h["attack_strength"])
-        defensive_candidates.append({
-            "team_id": team_a_id,
-            "opponent_id": team_h_id,
-            "score": score_a_def,
-            "type": "Defensive",
-            "venue": "(A)"
-        })
-
-
-    # Sort and pick top 3
-    top_attack = sorted(attacking_candidates, key=lambda x: x["score"], reverse=True)[:3]
-    top_defence = sorted(defensive_candidates, key=lambda x: x["score"], reverse=True)[:3]
+        # Defensive Score: own Defence Strength + (6 - opponent Attack Strength)
+        _push_top(top_defence, 3, (h_defence + (6 - a_attack), -seq, team_h_id, team_a_id, "(H)"))
+        _push_top(top_defence, 3, (a_defence + (6 - h_attack), -seq - 1, team_a_id, team_h_id, "(A)"))
+        seq += 2
+
+    # Highest score first
+    top_attack.sort(reverse=True)
+    top_defence.sort(reverse=True)
 
     lines = [f"*🎯 Captaincy & Transfer Targets (GW {current_gw_id})*\n"]
     
     lines.append("*Top 3 Attacking Fixtures (Goals/Assists potential):*")
-    for i, c in enumerate(top_attack):
-        team_name = team_data_map[c["team_id"]]["short_name"]
-        opp_name = team_data_map[c["opponent_id"]]["short_name"]
-        lines.append(f"{i+1}. {team_name} {c['venue']} vs {opp_name} (Score: {round(c['score'], 2)})")
+    for i, (score, _, team_id, opponent_id, venue) in enumerate(top_attack):
+        team_name = team_data_map[team_id]["short_name"]
+        opp_name = team_data_map[opponent_id]["short_name"]
+        lines.append(f"{i+1}. {team_name} {venue} vs {opp_name} (Score: {score:.2f})")
 
     lines.append("\n*Top 3 Defensive Fixtures (Clean Sheet potential):*")
-    for i, c in enumerate(top_defence):
-        team_name = team_data_map[c["team_id"]]["short_name"]
-        opp_name = team_data_map[c["opponent_id"]]["short_name"]
-        lines.append(f"{i+1}. {team_name} {c['venue']} vs {opp_name} (Score: {round(c['score'], 2)})")
-        
-    return "\n".join(lines) + "\n══════════════════════"
+    for i, (score, _, team_id, opponent_id, venue) in enumerate(top_defence):
+        team_name = team_data_map[team_id]["short_name"]
+        opp_name = team_data_map[opponent_id]["short_name"]
+        lines.append(f"{i+1}. {team_name} {venue} vs {opp_name} (Score: {score:.2f})")
+
+    lines.append(DIVIDER)
+    return "\n".join(lines)
 
-def get_personal_analysis(my_picks, elements, teams_map_short):
+def get_personal_analysis(my_picks, my_squad, players_by_pos, picks_stale=False):
     """
     Analyzes the user's current squad for captaincy and suggests potential transfers.
+    picks_stale marks a squad served from the cached fallback; both headings then say so.
     """
     if not my_picks:
         return "*Personalized Analysis:* FPL Team ID not set or team data unavailable."
 
-    my_squad = [p for p in elements if p.get("id") in my_picks]
+    # my_squad is already resolved by the caller; only its 15 players are bucketed here
+    squad_by_pos = bucket_by_position(my_squad)
     
-    if not my_squad:
+    if not any(squad_by_pos.values()):
         return "*Personalized Analysis:* No players found matching your squad."
 
-    analysis_lines = []
-    
     # --- 1. Captaincy Suggestion ---
     
-    # Sort my squad based on the pre-calculated 'form_fixture_score'
-    captaincy_candidates = sorted(my_squad, key=lambda x: x.get("form_fixture_score", 0), reverse=True)
+    # Best squad player by the pre-calculated 'form_fixture_score' (ties go to the earlier position)
+    best_candidate = max((p for squad_pos in squad_by_pos.values() for p in squad_pos),
+                         key=itemgetter("form_fixture_score"), default=None)
     
-    captain_text = "*👑 Your Captaincy Suggestion (GW Next):*"
-    if captaincy_candidates:
-        best_candidate = captaincy_candidates[0]
-        team_short = teams_map_short.get(best_candidate.get("team"), '?')
-        score = round(best_candidate.get("form_fixture_score", 0), 2)
+    # Flag advice built from the last cached squad because the API was unreachable
+    stale_marker = " (stale)" if picks_stale else ""
+
+    lines = [f"*👑 Your Captaincy Suggestion (GW Next){stale_marker}:*"]
+    if best_candidate:
+        team_short = best_candidate["team_short"]
+        score = best_candidate.get("form_fixture_score", 0)
         
-        captain_text += (
-            f"\nYour best pick is *{best_candidate.get('web_name', 'N/A')}* ({team_short})."
-            f"\n  - Metric Score (Form x Fixture): {score}"
-            f"\n  - Next 3 Fixtures: {best_candidate.get('next_fixtures', 'N/A')}"
-        )
+        lines.append(f"Your best pick is *{best_candidate.get('web_name', 'N/A')}* ({team_short}).")
+        lines.append(f"  - Metric Score (Form x Fixture): {score:.2f}")
+        lines.append(f"  - Next 3 Fixtures: {best_candidate.get('next_fixtures', 'N/A')}")
     else:
-        captain_text += "\nNo suitable captain candidates found in your squad."
-    
-    analysis_lines.append(captain_text)
+        lines.append("No suitable captain candidates found in your squad.")
 
     # --- 2. Transfer Suggestions ---
 
-    # Get the top 3 watchlist players for each position
-    watchlist_by_pos = {}
-    for pos_id, pos_name in POSITION_MAP.items():
-        players_in_pos = [p for p in elements if p.get("element_type") == pos_id]
-        # Calculate watch score as in build_watchlist
-        for p in players_in_pos:
-            p["watch_score"] = (p.get("form_fixture_score", 0) * 2) + p.get("points_per_cost", 0)
-        
-        # Only look at players NOT already in the user's squad for buying suggestions
-        top_watch = sorted([p for p in players_in_pos if p["id"] not in my_picks], 
-                           key=lambda x: p.get("watch_score", 0), reverse=True)[:3]
-        watchlist_by_pos[pos_id] = top_watch
+    # Best watchlist player per position (by the precomputed watch_score), only
+    # looking at players NOT already in the user's squad for buying suggestions
+    best_buy_by_pos = {
+        pos_id: max((p for p in players_by_pos[pos_id] if p["id"] not in my_picks),
+                    key=itemgetter("watch_score"), default=None)
+        for pos_id, _ in POSITIONS
+    }
 
-    transfer_suggestions = []
+    lines.append(f"\n\n*🛒 Transfer Suggestions (Sell Weakest Player){stale_marker}:*")
+    suggestions_start = len(lines)
     
     # Analyze squad for weakest players
-    for pos_id, pos_name in POSITION_MAP.items():
-        squad_pos = [p for p in my_squad if p.get("element_type") == pos_id]
+    for pos_id, pos_name in POSITIONS:
+        squad_pos = squad_by_pos[pos_id]
         if not squad_pos:
             continue
             
-        # Filter for players who have played this season (Total Points > 0)
-        active_squad_pos = [p for p in squad_pos if p.get("total_points", 0) > 0]
-        
-        # Sort by weakest Form/Fixture score (lower score is worse)
-        weakest_players = sorted(active_squad_pos, key=lambda x: x.get("form_fixture_score", 0))
+        # Weakest Form/Fixture score (lower score is worse) among players who have played
+        player_to_sell = min((p for p in squad_pos if p["active"]), key=itemgetter("form_fixture_score"), default=None)
 
-        if weakest_players:
-            player_to_sell = weakest_players[0]
+        if player_to_sell:
             sell_score = player_to_sell.get("form_fixture_score", 0)
             
             # Compare against the top watchlist player in that position
-            top_buy_candidates = watchlist_by_pos.get(pos_id, [])
+            player_to_buy = best_buy_by_pos[pos_id]
             
-            if top_buy_candidates:
-                player_to_buy = top_buy_candidates[0]
+            if player_to_buy:
                 buy_score = player_to_buy.get("form_fixture_score", 0)
                 
                 # Suggest a transfer if the potential buy is significantly better (e.g., score difference > 1.0)
                 if buy_score > sell_score + 1.0:
-                    sell_team = teams_map_short.get(player_to_sell.get("team"), '?')
-                    buy_team = teams_map_short.get(player_to_buy.get("team"), '?')
+                    sell_team = player_to_sell["team_short"]
+                    buy_team = player_to_buy["team_short"]
                     
                     sell_name = player_to_sell.get('web_name', 'N/A')
                     buy_name = player_to_buy.get('web_name', 'N/A')
                     
-                    transfer_suggestions.append(
-                        f"🔄 *{pos_name}:* Sell *{sell_name}* ({sell_team}, Score: {round(sell_score, 2)}) "
-                        f"for *{buy_name}* ({buy_team}, Score: {round(buy_score, 2)})"
+                    lines.append(
+                        f"🔄 *{pos_name}:* Sell *{sell_name}* ({sell_team}, Score: {sell_score:.2f}) "
+                        f"for *{buy_name}* ({buy_team}, Score: {buy_score:.2f})"
                     )
 
-    transfer_text = "\n*🛒 Transfer Suggestions (Sell Weakest Player):*"
-    transfer_text += "\n" + "\n".join(transfer_suggestions) if transfer_suggestions else "\nYour squad looks well-balanced for the upcoming fixtures! No strong transfer calls."
+    if len(lines) == suggestions_start:
+        lines.append("Your squad looks well-balanced for the upcoming fixtures! No strong transfer calls.")
 
-    analysis_lines.append(transfer_text)
-    
-    return "\n\n".join(analysis_lines) + "\n══════════════════════"
+    lines.append(DIVIDER)
+    return "\n".join(lines)
 
 # The original get_player_health_status function is removed as requested.
 
-def summarize_players(elements, teams_map_short):
-    summaries = []
-    
-    # Enhanced formatting function
-    def fmt(title, data, metric, round_digits=2, show_fixtures=False):
-        # Use an improved separator for aesthetics
-        section_title = f"\n\n\n*🔸 {title} 🔸*\n{'—' * 20}"
-        if not data: return f"{section_title}\nNone"
+def format_player_section(out, title, data, metric, round_digits=2, show_fixtures=False):
+    """Appends one ranked player list (e.g. 'Top 5 Form Players') for the detailed stats to `out`."""
+    # Use an improved separator for aesthetics
+    out.append(f"\n\n\n*🔸 {title} 🔸*\n{SECTION_RULE}")
+    if not data:
+        out.append("\nNone")
+        return
 
-        lines = []
-        for i, p in enumerate(data):
-            val = p.get(metric, 0)
-            val_str = str(round(val, round_digits)) if isinstance(val, (float, int)) else str(val)
-            
-            team_short = teams_map_short.get(p.get("team"), '?')
-            total_points = p.get('total_points', 0) # Fetched total points
-            
-            # Player line: Rank. Name (Team) (Metric Score) (Pts: Total Points) [Fixtures]
-            # Updated line construction to include total points
-            line = f"{i+1}. {p.get('web_name', 'N/A')} ({team_short}) ({val_str}) (Pts: {total_points})"
-            
-            if show_fixtures:
-                line += f" (Next 3: {p.get('next_fixtures', 'N/A')})"
-                
-            lines.append(line)
-            
-        return f"{section_title}\n" + "\n".join(lines)
+    # Metrics are numeric, so the value format is fixed once per section
+    val_spec = f".{round_digits}f"
+    append = out.append
+    for i, p in enumerate(data, 1):
+        get = p.get
+        val_str = format(get(metric, 0), val_spec)
+        
+        team_short = p["team_short"]
+        total_points = get('total_points', 0) # Fetched total points
+        
+        # Player line: Rank. Name (Team) (Metric Score) (Pts: Total Points) [Fixtures]
+        # Updated line construction to include total points
+        append(f"\n{i}. {get('web_name', 'N/A')} ({team_short}) ({val_str}) (Pts: {total_points})")
+        
+        if show_fixtures:
+            append(f" (Next 3: {get('next_fixtures', 'N/A')})")
 
-    for pos_id, pos_name in POSITION_MAP.items():
-        players = [p for p in elements if p.get("element_type") == pos_id]
+def summarize_players(players_by_pos):
+    summaries = []
+    
+    for pos_id, pos_name in POSITIONS:
+        players = players_by_pos[pos_id]
         
         # --- Data Sorting ---
         # Transfers In/Out: Keep round_digits=0
-        top_in = sorted(players, key=lambda x: x.get("transfers_in_event", 0), reverse=True)[:5]
-        top_out = sorted(players, key=lambda x: x.get("transfers_out_event", 0), reverse=True)[:5]
+        top_in = heapq.nlargest(5, players, key=itemgetter("transfers_in_event"))
+        top_out = heapq.nlargest(5, players, key=itemgetter("transfers_out_event"))
         
         # Top 10 Value: show_fixtures=True
-        top_value = sorted(players, key=lambda x: x.get("points_per_cost", 0), reverse=True)[:10]
+        top_value = heapq.nlargest(10, players, key=itemgetter("points_per_cost"))
 
         # Top 5 Form: show_fixtures=True
-        top_form = sorted(players, key=lambda x: x.get("form_value", 0), reverse=True)[:5]
+        top_form = heapq.nlargest(5, players, key=itemgetter("form_value"))
         
         # Top 5 Differentials: Keep round_digits=0, show_fixtures=True
-        diffs = [p for p in players if float(p.get("selected_by_percent", 0)) < 10]
-        top_diff = sorted(diffs, key=lambda x: x.get("total_points", 0), reverse=True)[:5]
+        diffs = [p for p in players if p["own_pct"] < 10]
+        top_diff = heapq.nlargest(5, diffs, key=itemgetter("total_points"))
 
         # Top 5 Form + Fixture: show_fixtures=True
-        top_fixture_form = sorted(players, key=lambda x: x.get("form_fixture_score", 0), reverse=True)[:5]
+        top_fixture_form = heapq.nlargest(5, players, key=itemgetter("form_fixture_score"))
         
         # --- Section Assembly ---
-        # Fixed the string concatenation issue here by using f-string continuation (less prone to error)
-        section = (
-            f"\n\n\n⭐ *{pos_name} Analysis* ⭐"
-            f"{fmt('Top 5 Transfers IN (This GW)', top_in, 'transfers_in_event', 0)}"
-            f"{fmt('Top 5 Transfers OUT (This GW)', top_out, 'transfers_out_event', 0)}"
-            f"{fmt('Top 10 Points/Cost Value', top_value, 'points_per_cost', 2, show_fixtures=True)}"
-            f"{fmt('Top 5 Form Players', top_form, 'form_value', 2, show_fixtures=True)}"
-            f"{fmt('Top 5 Differentials (<10% Ownership)', top_diff, 'total_points', 0, show_fixtures=True)}"
-            f"{fmt('Top 5 Form + Fixture Rating', top_fixture_form, 'form_fixture_score', 2, show_fixtures=True)}"
-        )
-        summaries.append(section)
+        # Every section appends its pieces to one list, joined once per position
+        out = [f"\n\n\n⭐ *{pos_name} Analysis* ⭐"]
+        format_player_section(out, 'Top 5 Transfers IN (This GW)', top_in, 'transfers_in_event', 0)
+        format_player_section(out, 'Top 5 Transfers OUT (This GW)', top_out, 'transfers_out_event', 0)
+        format_player_section(out, 'Top 10 Points/Cost Value', top_value, 'points_per_cost', 2, show_fixtures=True)
+        format_player_section(out, 'Top 5 Form Players', top_form, 'form_value', 1, show_fixtures=True)
+        format_player_section(out, 'Top 5 Differentials (<10% Ownership)', top_diff, 'total_points', 0, show_fixtures=True)
+        format_player_section(out, 'Top 5 Form + Fixture Rating', top_fixture_form, 'form_fixture_score', 2, show_fixtures=True)
+        summaries.append("".join(out))
 
     return summaries # Return the list of sections instead of a single string
 
 
-def build_watchlist(elements, teams_map_short):
-    # watch_score = (form_fixture_score * 2) + points_per_cost
+def build_watchlist(players_by_pos):
+    # Ranked by watch_score (computed in enrich_players)
     watch_sections = []
     
-    for pos_id, pos_name in POSITION_MAP.items():
-        players = [p for p in elements if p.get("element_type") == pos_id]
-        
-        for p in players:
-            p["watch_score"] = (p.get("form_fixture_score", 0) * 2) + p.get("points_per_cost", 0)
+    for pos_id, pos_name in POSITIONS:
+        players = players_by_pos[pos_id]
 
-        top_watch = sorted(players, key=lambda x: x.get("watch_score", 0), reverse=True)[:3] # Changed to top 3 for more options
+        top_watch = heapq.nlargest(3, players, key=itemgetter("watch_score")) # Changed to top 3 for more options
         
         lines = []
         for i, p in enumerate(top_watch):
-            team_short = teams_map_short.get(p.get("team"), '?')
+            team_short = p["team_short"]
             price = (p.get("now_cost", 0) / 10)
-            form = round(p.get("form_value", 0), 2)
-            fdr = p.get("fixture_difficulty", 3.0)
-            owned = p.get("selected_by_percent", "0")
+            form = p.get("form_value", 0)
+            fdr = p.get("fixture_difficulty", DEFAULT_FDR)
+            owned = p["own_pct"]
             
             # Combine stats into a more compact line
             lines.append(
-                f"{i+1}. *{p.get('web_name', 'N/A')}* ({team_short}) — £{price} "
-                f"(Own:{owned}% | Form:{form} | FDR:{fdr})"
+                f"{i+1}. *{p.get('web_name', 'N/A')}* ({team_short}) — £{price:.1f} "
+                f"(Own:{owned:.1f}% | Form:{form:.1f} | FDR:{fdr:.2f})"
             )
             # Add fixtures on a separate, indented line for readability
             lines.append(f"   > Next 3: {p.get('next_fixtures', 'N/A')}")
@@ -452,9 +680,11 @@ def get_team_summary(team_id):
         return ""
     try:
         url = f"https://fantasy.premierleague.com/api/entry/{team_id}/"
-        data = safe_fetch_json(url)
+        data, is_stale = cached_fetch_json_with_status(url, ENTRY_TTL)
         if not data:
             raise Exception("No team data received.")
+        # Flag a summary served from the last cached copy because the API was unreachable
+        stale_marker = " (stale)" if is_stale else ""
 
         name = data.get("name", "N/A")
         player_name = f"{data.get('player_first_name', '')} {data.get('player_last_name', '')}".strip()
@@ -463,14 +693,14 @@ def get_team_summary(team_id):
         transfers = data.get("last_deadline_total_transfers", "N/A")
         
         return (
-            f"\n\n*👤 Your Team: {name} ({player_name})*\n"
+            f"\n\n*👤 Your Team: {name} ({player_name}){stale_marker}*\n"
             f"📈 *Overall Rank:* {rank}\n"
             f"📊 *Total Points:* {points}\n"
             f"🔄 *Last GW Transfers:* {transfers}\n"
-            "══════════════════════"
+            f"{DIVIDER}"
         )
     except Exception:
-        return "\n\n*Could not fetch your team summary.*\n══════════════════════"
+        return f"\n\n*Could not fetch your team summary.*\n{DIVIDER}"
 
 
 # === MAIN DIGEST ===
@@ -482,8 +712,23 @@ def run_daily_digest():
     # Convert FPL_TEAM_ID to string if it was set directly to an integer
     fpl_team_id_str = str(FPL_TEAM_ID) if FPL_TEAM_ID is not None else None
 
-    data = get_fpl_data()
-    fixtures = get_fixtures()
+    # The FPL endpoints are independent, so fetch them concurrently (latency ~ max, not sum)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        data_future = executor.submit(get_fpl_data)
+        fixtures_future = executor.submit(get_fixtures)
+        # The user-specific endpoints are never requested without a team ID
+        if HAS_PERSONAL:
+            team_summary_future = executor.submit(get_team_summary, fpl_team_id_str)
+            my_picks_future = executor.submit(get_my_team_picks, fpl_team_id_str)
+        data, data_stale = data_future.result()
+        fixtures, fixtures_stale = fixtures_future.result()
+        team_summary, my_picks, picks_stale = "", frozenset(), False
+        if HAS_PERSONAL:
+            team_summary = team_summary_future.result()
+            # NEW: Get user's current squad picks
+            # Frozen at the boundary: only ever used for membership tests
+            my_picks, picks_stale = my_picks_future.result()
+            my_picks = frozenset(my_picks or ())
 
     if not data or not fixtures:
         print("ERROR: Essential FPL data not available. Exiting.")
@@ -494,60 +739,71 @@ def run_daily_digest():
         print("INFO: Could not find next GW deadline. Perhaps the season is over?")
         return
 
+    now = datetime.now(timezone.utc)
+    # A cached bootstrap whose next deadline has already passed describes a gameweek
+    # that is locked; sending it would present days-old data as current.
+    if data_stale and deadline <= now:
+        print("ERROR: FPL API unreachable and the cached bootstrap is out of date. Exiting.")
+        return
+
     teams = data.get("teams", [])
     # NEW: Get richer team data map including attack/defense strengths
     team_data_map = get_team_data_map(teams)
     # Derive the simple short-name map for functions that only needs the name
     teams_map_short = {t_id: d["short_name"] for t_id, d in team_data_map.items()}
     
-    # 1. Calculate FDR (Average difficulty of next 3 *fixtures*)
-    team_fdr = calculate_fixture_difficulty(fixtures, teams)
-    # 2. Build detailed fixture map (Opponent and difficulty strings) - NOW FIXED TO INCLUDE CURRENT GW
-    team_fixture_map = build_fixture_map(fixtures, teams_map_short, gw_id)
-    # 3. Enrich players with both FDR (for scoring) and fixture map (for display)
-    elements = enrich_players(data.get("elements", []), team_fdr, team_fixture_map)
-    
-    # NEW: Get user's current squad picks
-    my_picks = get_my_team_picks(fpl_team_id_str)
+    # 1. FDR (average difficulty of the next 3 fixtures) and the matching fixture
+    #    strings, from one pass over the unplayed fixtures - INCLUDES CURRENT GW
+    team_fixture_info = build_team_fixture_info(fixtures, teams_map_short, gw_id)
+    # 2. Enrich players with both FDR (for scoring) and fixture strings (for display)
+    elements = enrich_players(data.get("elements", []), team_fixture_info, teams_map_short)
+    # 3. Group players by position once; the summaries below read from these buckets
+    players_by_pos = bucket_by_position(elements)
+    # The user's squad, resolved once here and handed to the personal analysis
+    my_squad = [p for p in elements if p["id"] in my_picks] if my_picks else []
 
     # Time calculations
-    now = datetime.now(timezone.utc)
     diff = deadline - now
     days = diff.days
     hours = (diff.seconds // 3600)
 
+    # Flag a digest built from the cached fallback because the FPL API was unreachable
+    stale_line = "⚠️ *Stale data:* FPL API unreachable, using the last cached copy\n" if data_stale or fixtures_stale or picks_stale else ""
+
     header = (
         f"⚽ *FPL Daily Digest: {gw_name}*\n"
         f"🚨 *DEADLINE:* {deadline.astimezone().strftime('%a %d %b %H:%M %Z')}\n"
         f"⏳ *Time Remaining:* {days}d {hours}h\n"
-        "══════════════════════"
+        f"{stale_line}"
+        f"{DIVIDER}"
     )
 
-    team_summary = get_team_summary(fpl_team_id_str)
-    watchlist_text = build_watchlist(elements, teams_map_short)
+    watchlist_text = build_watchlist(players_by_pos)
     # NEW: Captaincy and transfer picks based on team strength metrics (GENERAL)
     # The current_gw_id passed here is the ID of the UPCOMING Gameweek
     captaincy_picks = get_captaincy_picks(team_data_map, fixtures, gw_id)
     # NEW: Personalized analysis for the user's squad (CAPTAINCY & TRANSFERS)
-    personal_analysis = get_personal_analysis(my_picks, elements, teams_map_short)
+    personal_analysis = get_personal_analysis(my_picks, my_squad, players_by_pos, picks_stale)
     
     # Returns a list of sections, not a single string
-    position_summaries = summarize_players(elements, teams_map_short) 
+    position_summaries = summarize_players(players_by_pos) 
 
     # 1. Send Chunk 1 (Header, Team Summary, General Picks, Personalized Analysis, Watchlist)
-    # Fixed the string concatenation issue here
-    chunk1 = (
-        f"{header}\n{team_summary}\n\n" +
-        f"{captaincy_picks}\n\n" +
-        f"{personal_analysis}\n\n" + # <-- Personalized analysis inserted here
-        f"*🔥 High-Priority Watchlist (Top 3 by Position)*\n\n" +
-        f"{watchlist_text}\n" +
-        f"══════════════════════\n" +
-        f"*Detailed Player Statistics will follow in separate messages.*"
-    )
+    # Assembled from a list of fragments with a single join (no intermediate copies)
+    chunk1 = "".join([
+        header, "\n", team_summary, "\n\n",
+        captaincy_picks, "\n\n",
+        personal_analysis, "\n\n", # <-- Personalized analysis inserted here
+        "*🔥 High-Priority Watchlist (Top 3 by Position)*\n\n",
+        watchlist_text, "\n",
+        DIVIDER, "\n",
+        "*Detailed Player Statistics will follow in separate messages.*",
+    ])
     send_telegram_message(chunk1)
 
     # 2. Send Chunk 2+ (Detailed Stats split by position)
+    # Sent one after another so they arrive in GK/DEF/MID/FWD order; the shared
+    # session's keep-alive connection already saves the per-send handshake.
     for section_text in position_summaries:
         send_telegram_message(section_text)
 